@@ -1,5 +1,8 @@
+import inflect
+
 from collections import namedtuple
 from enum import Enum
+from functools import lru_cache
 from typing import Set, List, Any
 from dataclasses import dataclass, field
 
@@ -69,6 +72,16 @@ def get_module_from_data_type(data_type: DataType):
     return None
 
 
+@lru_cache(maxsize=None)
+def get_inflect_engine() -> inflect.engine:
+    """get the inflect engine shared by the whole package, creating it the first time it is needed
+
+    Returns:
+        inflect.engine: the inflect engine
+    """
+    return inflect.engine()
+
+
 @dataclass
 class CommonAncestor:
     node_id: Any
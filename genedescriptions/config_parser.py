@@ -1,12 +1,15 @@
 import json
+import re
 import urllib.request
 
 import yaml
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Pattern, Tuple, Union
 from genedescriptions.commons import Module
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
 
 class ConfigModuleProperty(Enum):
     RENAME_TERMS = 1
@@ -33,6 +36,7 @@ class GenedescConfigParser(object):
     def __init__(self, file_path):
         with open(file_path) as conf_file:
             self.config = yaml.safe_load(conf_file)
+            self.special_cases_patterns = {}
             self.add_go_do_not_annotate_to_blacklist(
                 'http://current.geneontology.org/ontology/subsets/gocheck_do_not_annotate.json')
             self.add_go_do_not_annotate_to_blacklist(
@@ -112,23 +116,40 @@ class GenedescConfigParser(object):
     def get_prepostfix_sentence_map(self, module: Module, special_cases_only: bool = False, humans: bool = False):
         module_name = self._get_module_name(module)
         if special_cases_only:
-            return {prepost["aspect"] + "|" + prepost["group"] + "|" + prepost["qualifier"]: [
+            return {(prepost["aspect"], prepost["group"], prepost["qualifier"]): [
                 (sp_case["id"], sp_case["match_regex"], sp_case["prefix"], sp_case["postfix"])
                 for sp_case in prepost["special_cases"]]
                 for prepost in self.config[module_name]["prepostfix_sentences_map"] if
                 "special_cases" in prepost and prepost["special_cases"]}
         else:
-            prepost_map = {prepost["aspect"] + "|" + prepost["group"] + "|" + prepost["qualifier"]: (
+            prepost_map = {(prepost["aspect"], prepost["group"], prepost["qualifier"]): (
                 prepost["prefix"], prepost["postfix"]) for prepost in self.config[module_name][
                 "prepostfix_sentences_map_humans" if humans else "prepostfix_sentences_map"]}
             special_cases_only = self.get_prepostfix_sentence_map(module=module, special_cases_only=True, humans=humans)
-            for key, scs in special_cases_only.items():
-                key_arr = key.split("|")
+            for (aspect, group, qualifier), scs in special_cases_only.items():
                 for special_case in scs:
-                    prepost_map[key_arr[0] + "|" + key_arr[1] + str(special_case[0]) + "|" + key_arr[2]] = \
-                        (special_case[2], special_case[3])
+                    prepost_map[(aspect, group + str(special_case[0]), qualifier)] = (special_case[2], special_case[3])
             return prepost_map
 
+    def get_special_cases_patterns(self, module: Module) -> Dict[Tuple[str, str, str],
+                                                                 List[Tuple[int, str, Union[Pattern, None]]]]:
+        """get the patterns of the special cases in the prefix and postfix sentences map, compiled once per config
+
+        Args:
+            module (Module): the module
+        Returns:
+            Dict[Tuple[str, str, str], List[Tuple[int, str, Union[Pattern, None]]]]: the id, the pattern, and the
+                compiled pattern of each special case, indexed by (aspect, group, qualifier). Patterns without regex
+                metacharacters match exactly the labels that start with them and are not compiled
+        """
+        if module not in self.special_cases_patterns:
+            self.special_cases_patterns[module] = {
+                key: [(special_case[0], special_case[1], None if _REGEX_METACHARACTERS.isdisjoint(special_case[1])
+                       else re.compile(special_case[1])) for special_case in special_cases]
+                for key, special_cases in self.get_prepostfix_sentence_map(module=module,
+                                                                           special_cases_only=True).items()}
+        return self.special_cases_patterns[module]
+
     def get_annotations_priority(self, module: Module) -> List[str]:
         module_name = self._get_module_name(module)
         return [key for key, priority in sorted(
@@ -1,22 +1,23 @@
+import csv
 import gzip
+import io
 import logging
 import urllib.request
 import shutil
 import os
 import re
-import inflect
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from collections import defaultdict
-from typing import List, Iterable, Dict
-from ontobio import AssociationSetFactory
+from typing import List, Iterable, Dict, Tuple, Set
 from ontobio.io.assocparser import AssocParserConfig
 from ontobio.io.gafparser import GafParser
 from ontobio.model.association import GoAssociation
 from ontobio.ontol_factory import OntologyFactory
 from ontobio.ontol import Ontology
 from ontobio.assocmodel import AssociationSet
-from genedescriptions.commons import Gene, DataType, Module, get_module_from_data_type
+from genedescriptions.commons import Gene, DataType, Module, get_module_from_data_type, get_inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser, ConfigModuleProperty
 from genedescriptions.ontology_tools import set_all_depths, set_ic_annot_freq, set_ic_ontology_struct
 
@@ -32,6 +33,12 @@ class ExpressionClusterFeature(Enum):
     STUDIES = 3
 
 
+SLIM_CACHE_FILE_NAMES = {
+    DataType.GO: "go_slim.obo",
+    DataType.DO: "do_slim.obo",
+    DataType.EXPR: "expr_slim.obo"}
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +69,9 @@ class DataManager(object):
         self.do_slim = set()
         self.exp_slim = set()
         self.use_cache = use_cache
+        self.prefetched_files = {}
+        self.obsolete_terms = {}
+        self.filtered_genes_cache = {}
 
     def get_ontology(self, data_type: DataType):
         if data_type == DataType.DO:
@@ -92,16 +102,12 @@ class DataManager(object):
 
     @staticmethod
     def get_slim_cache_path(ontology_cache_path, data_type: DataType):
-        slim_name = "slim.obo"
-        if data_type == DataType.GO:
-            slim_name = "go_slim.obo"
-        elif data_type == DataType.DO:
-            slim_name = "do_slim.obo"
-        elif data_type == DataType.EXPR:
-            slim_name = "expr_slim.obo"
-        return os.path.join(os.path.dirname(os.path.normpath(ontology_cache_path)), slim_name)
+        return os.path.join(os.path.dirname(os.path.normpath(ontology_cache_path)),
+                            SLIM_CACHE_FILE_NAMES.get(data_type, "slim.obo"))
 
     def _get_cached_file(self, cache_path: str, file_source_url):
+        if cache_path in self.prefetched_files:
+            return self.prefetched_files.pop(cache_path)
         if not os.path.isfile(cache_path):
             os.makedirs(os.path.dirname(cache_path), exist_ok=True)
             logger.info(f"downloading file {file_source_url}")
@@ -116,6 +122,31 @@ class DataManager(object):
             file_path = cache_path.replace(".gz", "")
         return file_path
 
+    def prefetch_files(self, sources_and_cache_paths: List[Tuple[str, str]], max_workers: int = 4) -> None:
+        """download a set of independent files in parallel, so that the following load operations read them from the
+        local cache
+
+        Args:
+            sources_and_cache_paths (List[Tuple[str, str]]): list of (file source url, cache path) pairs. Pairs with
+                empty values are ignored
+            max_workers (int): maximum number of concurrent downloads
+        """
+        sources_and_cache_paths = [(file_source_url, cache_path) for file_source_url, cache_path in
+                                   sources_and_cache_paths if file_source_url and cache_path]
+        logger.info(f"prefetching {len(sources_and_cache_paths)} files")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_paths = executor.map(lambda source_and_path: self._get_cached_file(
+                file_source_url=source_and_path[0], cache_path=source_and_path[1]), sources_and_cache_paths)
+            for (_, cache_path), file_path in zip(sources_and_cache_paths, file_paths):
+                self.prefetched_files[cache_path] = file_path
+
+    def discard_prefetched_files(self) -> None:
+        """forget the prefetched files that have not been read, so that following loads do not reuse them and download
+        them again if the cache is not used"""
+        if self.prefetched_files:
+            logger.debug(f"discarding {len(self.prefetched_files)} prefetched files that have not been read")
+        self.prefetched_files = {}
+
     def get_gene_data(self, include_dead_genes: bool = False, include_pseudo_genes: bool = False) -> Gene:
         """get all gene data from the fetcher, returning one gene per call
 
@@ -126,9 +157,19 @@ class DataManager(object):
             Gene: data for one gene per each call, including gene_id and gene_name
         """
         if self.gene_data and len(self.gene_data) > 0:
-            for gene_id, gene_obj in self.gene_data.items():
-                if (include_dead_genes or not gene_obj.dead) and (include_pseudo_genes or not gene_obj.pseudo):
-                    yield gene_obj
+            filter_key = (include_dead_genes, include_pseudo_genes)
+            if filter_key not in self.filtered_genes_cache:
+                genes = self.gene_data.values()
+                if include_dead_genes and include_pseudo_genes:
+                    filtered_genes = tuple(genes)
+                elif include_dead_genes:
+                    filtered_genes = tuple(gene_obj for gene_obj in genes if not gene_obj.pseudo)
+                elif include_pseudo_genes:
+                    filtered_genes = tuple(gene_obj for gene_obj in genes if not gene_obj.dead)
+                else:
+                    filtered_genes = tuple(gene_obj for gene_obj in genes if not gene_obj.dead and not gene_obj.pseudo)
+                self.filtered_genes_cache[filter_key] = filtered_genes
+            yield from self.filtered_genes_cache[filter_key]
 
     @staticmethod
     def remove_blacklisted_annotations(association_set: AssociationSet, ontology: Ontology,
@@ -144,12 +185,16 @@ class DataManager(object):
         """
         logger.info("Removing blacklisted terms and annotations")
         if terms_blacklist:
-            associations = []
-            for subj_associations in association_set.associations_by_subj.values():
-                for association in subj_associations:
-                    if association["object"]["id"] not in terms_blacklist:
-                        associations.append(association)
-            return DataManager.create_annot_set_from_legacy_assocs(assocs=associations, ontology=ontology)
+            terms_blacklist = frozenset(terms_blacklist)
+            # the (subject, object) index is smaller than the full annotation set. If none of its objects is
+            # blacklisted there is nothing to remove and the set does not need to be rebuilt
+            if association_set.associations_by_subj_obj is not None and not any(
+                    obj_id in terms_blacklist for _, obj_id in association_set.associations_by_subj_obj.keys()):
+                return association_set
+            return DataManager.create_annot_set_from_legacy_assocs(
+                assocs=(association for subj_associations in association_set.associations_by_subj.values() for
+                        association in subj_associations if association["object"]["id"] not in terms_blacklist),
+                ontology=ontology)
         else:
             return association_set
 
@@ -165,10 +210,26 @@ class DataManager(object):
         """
         logger.info("Renaming ontology terms")
         if terms_replacement_regex:
-            for regex_to_substitute, regex_target in terms_replacement_regex.items():
-                for node in ontology.search(regex_to_substitute, is_regex=True):
-                    ontology.node(node)["label"] = re.sub(regex_to_substitute, regex_target,
-                                                          ontology.node(node)["label"])
+            # literal keys are replaced through plain string operations, while real regular expressions are compiled
+            # once here. All the rules are then applied to each label in a single pass over the ontology, in config
+            # order
+            rename_rules = [(regex_to_substitute, regex_target, None) if re.escape(regex_to_substitute) ==
+                            regex_to_substitute and "\\" not in regex_target else
+                            (regex_to_substitute, regex_target, re.compile(regex_to_substitute)) for
+                            regex_to_substitute, regex_target in terms_replacement_regex.items()]
+            for node_id in ontology.nodes():
+                node = ontology.node(node_id)
+                label = node.get("label")
+                if not label:
+                    continue
+                for regex_to_substitute, regex_target, pattern in rename_rules:
+                    if pattern is None:
+                        if regex_to_substitute in label:
+                            label = label.replace(regex_to_substitute, regex_target)
+                    elif pattern.search(label):
+                        label = pattern.sub(regex_target, label)
+                if label != node["label"]:
+                    node["label"] = label
 
     def set_ontology(self, ontology_type: DataType, ontology: Ontology, config: GenedescConfigParser,
                      slim_cache_path: str = None) -> None:
@@ -180,47 +241,45 @@ class DataManager(object):
             config (GenedescConfigParser): configuration object where to read properties
             slim_cache_path (str): path to slim file to use
         """
+        relations = self.get_relations(ontology_type)
+        if relations:
+            ontology = ontology.subontology(relations=relations)
         if ontology_type == DataType.GO:
             logger.info("Setting GO ontology")
-            if self.go_relations:
-                self.go_ontology = ontology.subontology(relations=self.go_relations)
-            else:
-                self.go_ontology = ontology
+            self.go_ontology = ontology
         elif ontology_type == DataType.DO:
             logger.info("Setting DO ontology")
-            if self.do_relations:
-                self.do_ontology = ontology.subontology(relations=self.do_relations)
-            else:
-                self.do_ontology = ontology
+            self.do_ontology = ontology
         elif ontology_type == DataType.EXPR:
             logger.info("Setting Expression ontology")
-            if self.expr_relations:
-                self.expression_ontology = ontology.subontology(relations=self.expr_relations)
-            else:
-                self.expression_ontology = ontology
+            self.expression_ontology = ontology
+        self.obsolete_terms.pop(ontology_type, None)
         module = get_module_from_data_type(ontology_type)
-        ontology: Ontology = self.get_ontology(data_type=ontology_type)
         terms_replacement_regex = config.get_module_property(module=module, prop=ConfigModuleProperty.RENAME_TERMS)
         if terms_replacement_regex:
             self.rename_ontology_terms(ontology=ontology, terms_replacement_regex=terms_replacement_regex)
         root_nodes = [n for n in ontology.nodes() if len(
             list(ontology.parents(n))) == 0 and len(list(ontology.children(n))) > 0]
-        set_all_depths(ontology=ontology, root_node_ids=root_nodes, relations=self.get_relations(ontology_type))
+        set_all_depths(ontology=ontology, root_node_ids=root_nodes, relations=relations)
         if config.get_module_property(module=module,
                                       prop=ConfigModuleProperty.TRIMMING_ALGORITHM) == "ic":
-            set_ic_ontology_struct(ontology=ontology, relations=self.get_relations(ontology_type),
-                                   root_node_ids=root_nodes)
+            set_ic_ontology_struct(ontology=ontology, relations=relations, root_node_ids=root_nodes)
         if slim_cache_path:
             slim_url = config.get_module_property(module=module, prop=ConfigModuleProperty.SLIM_URL)
             self.load_slim(module=module, slim_url=slim_url, slim_cache_path=slim_cache_path)
 
     @staticmethod
     def add_article_to_nodes(ontology):
-        inflect_engine = inflect.engine()
-        for term in ontology.nodes():
-            if "label" in ontology.node(term) and \
-                    inflect_engine.singular_noun(ontology.node(term)["label"].split(" ")[-1]) is False:
-                ontology.node(term)["label"] = "the " + ontology.node(term)["label"]
+        inflect_engine = get_inflect_engine()
+        get_node = ontology.node
+        labeled_nodes = [(node, node["label"].rsplit(" ", 1)[-1]) for node in map(get_node, ontology.nodes()) if
+                         "label" in node]
+        # inflect is slow, so call it once per distinct last word instead of once per node
+        tail_is_singular = {tail: inflect_engine.singular_noun(tail) is False for tail in
+                            {tail for _, tail in labeled_nodes}}
+        for node, tail in labeled_nodes:
+            if tail_is_singular[tail]:
+                node["label"] = "the " + node["label"]
 
     def load_ontology_from_file(self, ontology_type: DataType, ontology_url: str, ontology_cache_path: str,
                                 config: GenedescConfigParser) -> None:
@@ -246,10 +305,12 @@ class DataManager(object):
                 relations = self.do_relations
             elif module == Module.EXPRESSION:
                 relations = None
-            slim_onto = OntologyFactory().create(self._get_cached_file(file_source_url=slim_url, cache_path=slim_cache_path)
-                                                 ).subontology(relations=relations)
-            slim_set = set([node for node in slim_onto.nodes() if "type" in slim_onto.node(node) and
-                            slim_onto.node(node)["type"] == "CLASS"])
+            slim_onto = OntologyFactory().create(self._get_cached_file(file_source_url=slim_url,
+                                                                       cache_path=slim_cache_path))
+            if relations:
+                slim_onto = slim_onto.subontology(relations=relations)
+            get_slim_node = slim_onto.node
+            slim_set = {node_id for node_id in slim_onto.nodes() if get_slim_node(node_id).get("type") == "CLASS"}
             if module == Module.GO:
                 logger.info("Setting GO Slim")
                 self.go_slim = slim_set
@@ -272,35 +333,39 @@ class DataManager(object):
     def create_annot_set_from_legacy_assocs(assocs, **args):
         amap = defaultdict(list)
         subject_label_map = {}
+        associations_by_subj = defaultdict(list)
+        associations_by_subj_obj = defaultdict(list)
+        # single pass, so that assocs can also be a generator
         for a in assocs:
             subj = a['subject']
             subj_id = subj['id']
-            subj_label = subj['label']
-            subject_label_map[subj_id] = subj_label
+            obj_id = a['object']['id']
+            subject_label_map[subj_id] = subj['label']
             if not a['negated']:
-                amap[subj_id].append(a['object']['id'])
+                amap[subj_id].append(obj_id)
+            associations_by_subj[subj_id].append(a)
+            associations_by_subj_obj[(subj_id, obj_id)].append(a)
 
         aset = AssociationSet(subject_label_map=subject_label_map, association_map=amap, **args)
-        aset.associations_by_subj = defaultdict(list)
-        aset.associations_by_subj_obj = defaultdict(list)
-        for a in assocs:
-            sub_id = a['subject']['id']
-            obj_id = a['object']['id']
-            aset.associations_by_subj[sub_id].append(a)
-            aset.associations_by_subj_obj[(sub_id, obj_id)].append(a)
+        aset.associations_by_subj = associations_by_subj
+        aset.associations_by_subj_obj = associations_by_subj_obj
         return aset
 
     @staticmethod
-    def remap_associations(associations: AssociationSet, ontology: Ontology, associations_map: Dict[str, str]):
+    def remap_associations(associations: AssociationSet, ontology: Ontology, associations_map: Dict[str, str],
+                           terms_blacklist: List[str] = None):
         if not associations_map:
             return associations
-        new_associations = []
-        for subj_associations in associations.associations_by_subj.values():
-            for association in subj_associations:
-                if association["object"]["id"] in associations_map:
-                    association["object"]["id"] = associations_map[association["object"]["id"]]
-                new_associations.append(association)
-        return DataManager.create_annot_set_from_legacy_assocs(assocs=new_associations, ontology=ontology)
+        terms_blacklist = frozenset(terms_blacklist) if terms_blacklist else frozenset()
+
+        def _remapped_associations():
+            for subj_associations in associations.associations_by_subj.values():
+                for association in subj_associations:
+                    if association["object"]["id"] in associations_map:
+                        association["object"]["id"] = associations_map[association["object"]["id"]]
+                    if association["object"]["id"] not in terms_blacklist:
+                        yield association
+        return DataManager.create_annot_set_from_legacy_assocs(assocs=_remapped_associations(), ontology=ontology)
 
     def set_associations(self, associations_type: DataType, associations: AssociationSet, config: GenedescConfigParser):
         """set the go annotations and remove blacklisted annotations
@@ -310,14 +375,17 @@ class DataManager(object):
             associations (AssociationSet): an association object to set as go annotations
             config (GenedescConfigParser): configuration object where to read properties
         """
-        assocs = self.remap_associations(associations=associations, ontology=self.get_ontology(associations_type),
-                                         associations_map=config.get_module_property(
-                                             module=get_module_from_data_type(associations_type),
-                                             prop=ConfigModuleProperty.REMAP_TERMS))
-        assocs = self.remove_blacklisted_annotations(
-            association_set=assocs, ontology=self.get_ontology(associations_type),
-            terms_blacklist=config.get_module_property(module=get_module_from_data_type(associations_type),
-                                                       prop=ConfigModuleProperty.EXCLUDE_TERMS))
+        module = get_module_from_data_type(associations_type)
+        associations_map = config.get_module_property(module=module, prop=ConfigModuleProperty.REMAP_TERMS)
+        terms_blacklist = config.get_module_property(module=module, prop=ConfigModuleProperty.EXCLUDE_TERMS)
+        if associations_map:
+            # remap and filter in the same pass, so that the association set is rebuilt only once
+            assocs = self.remap_associations(associations=associations, ontology=self.get_ontology(associations_type),
+                                             associations_map=associations_map, terms_blacklist=terms_blacklist)
+        else:
+            assocs = self.remove_blacklisted_annotations(association_set=associations,
+                                                         ontology=self.get_ontology(associations_type),
+                                                         terms_blacklist=terms_blacklist)
 
         if associations_type == DataType.GO:
             logger.info("Setting GO associations")
@@ -328,8 +396,7 @@ class DataManager(object):
         elif associations_type == DataType.EXPR:
             logger.info("Setting Expression associations")
             self.expression_associations = assocs
-        if config.get_module_property(module=get_module_from_data_type(associations_type),
-                                      prop=ConfigModuleProperty.TRIMMING_ALGORITHM) == "icGO":
+        if config.get_module_property(module=module, prop=ConfigModuleProperty.TRIMMING_ALGORITHM) == "icGO":
             set_ic_annot_freq(self.get_ontology(associations_type), self.get_associations(associations_type))
 
     def load_associations_from_file(self, associations_type: DataType, associations_url: str,
@@ -344,9 +411,12 @@ class DataManager(object):
         """
         logger.info("Loading associations from file")
         assoc_config = AssocParserConfig(remove_double_prefixes=True, paint=True)
-        assocs = AssociationSetFactory().create_from_assocs(assocs=GafParser(config=assoc_config).parse(
-            file=self._get_cached_file(cache_path=associations_cache_path, file_source_url=associations_url),
-            skipheader=True), ontology=self.get_ontology(associations_type))
+        # stream the parsed lines into the association set instead of materializing the whole file first
+        assocs = self.create_annot_set_from_legacy_assocs(
+            assocs=(association.to_hash_assoc() for association in GafParser(
+                config=assoc_config).association_generator(file=self._get_cached_file(
+                    cache_path=associations_cache_path, file_source_url=associations_url), skipheader=True)),
+            ontology=self.get_ontology(associations_type))
         self.set_associations(associations_type=associations_type, associations=assocs, config=config)
 
     def get_annotations_for_gene(self, gene_id: str, annot_type: DataType = DataType.GO,
@@ -386,34 +456,35 @@ class DataManager(object):
             ontology = self.expression_ontology
         if dataset is not None and ontology is not None:
             priority_map = dict(zip(priority_list, reversed(range(len(list(priority_list))))))
-            annotations = []
+            obsolete_terms = set() if include_obsolete else self._get_obsolete_terms(data_type=annot_type,
+                                                                                     ontology=ontology)
+            id_selected_annotation = {}
             for annotation in dataset.associations(gene_id):
-                if not ontology.has_node(annotation["object"]["id"]):
-                    continue
-                if (not include_obsolete and "deprecated" in ontology.node(annotation["object"]["id"])["meta"] and
-                        ontology.node(annotation["object"]["id"])["meta"]["deprecated"]):
+                # cheap checks on the annotation itself come first, ontology lookups last
+                if annotation["evidence"]["type"] not in priority_map:
                     continue
                 if not include_negative_results and ("NOT" in annotation["qualifiers"] or annotation["negated"]):
                     continue
-                if not ontology.label(annotation["object"]["id"]):
+                term_id = annotation["object"]["id"]
+                if term_id in obsolete_terms or not ontology.has_node(term_id) or not ontology.label(term_id):
                     continue
-                annotations.append(annotation)
-            id_selected_annotation = {}
-            for annotation in annotations:
-                if annotation["evidence"]["type"] in priority_map.keys():
-                    if annotation["object"]["id"] in id_selected_annotation:
-                        if priority_map[annotation["evidence"]["type"]] > \
-                                priority_map[id_selected_annotation[annotation["object"]["id"]]["evidence"]["type"]]:
-                            id_selected_annotation[annotation["object"]["id"]] = annotation
-                    else:
-                        id_selected_annotation[annotation["object"]["id"]] = annotation
-            return [annotation for annotation in id_selected_annotation.values()]
+                if term_id not in id_selected_annotation or priority_map[annotation["evidence"]["type"]] > \
+                        priority_map[id_selected_annotation[term_id]["evidence"]["type"]]:
+                    id_selected_annotation[term_id] = annotation
+            return list(id_selected_annotation.values())
         else:
             return []
 
+    def _get_obsolete_terms(self, data_type: DataType, ontology: Ontology) -> Set[str]:
+        if data_type not in self.obsolete_terms:
+            self.obsolete_terms[data_type] = {node_id for node_id in ontology.nodes() if
+                                              (ontology.node(node_id).get("meta") or {}).get("deprecated")}
+        return self.obsolete_terms[data_type]
+
     def set_gene_data(self, gene_data: List[Gene]):
         for gene in gene_data:
             self.gene_data[gene.id] = gene
+        self.filtered_genes_cache = {}
 
     def load_gene_data_from_file(self):
         pass
@@ -426,38 +497,37 @@ class DataManager(object):
             Dict[str, List[str]]: a dictionary of all human genes properties, indexed by HGNC ID
 
         """
-        human_genes_props = defaultdict(list)
-        human_content_w_ensmbl = urllib.request.urlopen("https://www.genenames.org/cgi-bin/download/custom?col=gd_hgnc_id&col=gd_pub_ensembl_id&col=gd_app_sym&col=gd_app_name&status=Approved&status=Entry%20Withdrawn&hgnc_dbtag=on&order_by=gd_app_sym_sort&format=text&submit=submit", timeout=60)
-
-        header = True
-        for line in human_content_w_ensmbl:
-            if not header:
-                linearr = line.decode("utf-8").split("\t")
-                linearr[-1] = linearr[-1].strip()
-                if linearr[1] != "":
-                    human_genes_props[linearr[0]] = [linearr[2], linearr[3]]
-            else:
-                header = False
+        human_genes_props = {}
+        for linearr in DataManager._get_tsv_rows_from_url(
+                "https://www.genenames.org/cgi-bin/download/custom?col=gd_hgnc_id&col=gd_pub_ensembl_id&col=gd_app_sym&col=gd_app_name&status=Approved&status=Entry%20Withdrawn&hgnc_dbtag=on&order_by=gd_app_sym_sort&format=text&submit=submit", timeout=60):
+            if linearr[1] != "":
+                human_genes_props[linearr[0]] = [linearr[2], linearr[3]]
         return human_genes_props
 
     @staticmethod
     def get_ensembl_hgnc_ids_map():
         human_genes_props = {}
-        human_content_w_ensmbl = urllib.request.urlopen("https://www.genenames.org/cgi-bin/download?col=gd_hgnc_id&col="
-                                                        "gd_pub_ensembl_id&status=Approved&status=Entry+Withdrawn&statu"
-                                                        "s_opt=2&where=&order_by=gd_app_sym_sort&format=text&limit=&hgn"
-                                                        "c_dbtag=on&submit=submit")
-        header = True
-        for line in human_content_w_ensmbl:
-            if not header:
-                linearr = line.decode("utf-8").split("\t")
-                linearr[-1] = linearr[-1].strip()
-                if linearr[1] != "":
-                    human_genes_props[linearr[1]] = linearr[0]
-            else:
-                header = False
+        for linearr in DataManager._get_tsv_rows_from_url(
+                "https://www.genenames.org/cgi-bin/download?col=gd_hgnc_id&col=gd_pub_ensembl_id&status=Approved"
+                "&status=Entry+Withdrawn&status_opt=2&where=&order_by=gd_app_sym_sort&format=text&limit=&hgnc_dbtag=on"
+                "&submit=submit"):
+            if linearr[1] != "":
+                human_genes_props[linearr[1]] = linearr[0]
         return human_genes_props
 
+    @staticmethod
+    def _get_tsv_rows_from_url(url: str, timeout: float = None):
+        """read a remote tab separated file with a header line, returning one list of fields per row. Without a timeout,
+        urlopen falls back to the global default socket timeout"""
+        with (urllib.request.urlopen(url, timeout=timeout) if timeout is not None else
+              urllib.request.urlopen(url)) as response:
+            reader = csv.reader(io.TextIOWrapper(response, encoding="utf-8", newline=""), delimiter="\t",
+                                quoting=csv.QUOTE_NONE)
+            next(reader, None)
+            for linearr in reader:
+                linearr[-1] = linearr[-1].strip()
+                yield linearr
+
     @staticmethod
     def create_annotation_record(source_line, gene_id, gene_symbol, gene_type, taxon_id, object_id, qualifiers, aspect,
                                  ecode, references, prvdr, date):
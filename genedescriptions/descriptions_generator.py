@@ -1,9 +1,14 @@
-from typing import Set
+import dataclasses
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Set, FrozenSet, Callable, Iterable, Tuple, Dict
 
-import inflect
 import re
 
-from genedescriptions.commons import Sentence, Module, DataType, TrimmingResult, get_data_type_from_module
+from genedescriptions.commons import Sentence, Module, DataType, TrimmingResult, get_data_type_from_module, \
+    get_inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser, ConfigModuleProperty
 from genedescriptions.data_manager import DataManager
 from genedescriptions.ontology_tools import *
@@ -16,6 +21,22 @@ from prefixcommons import curie_util
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _get_qualifier_key(qualifiers: Tuple[str, ...]) -> str:
+    """get the qualifier string used to group annotations, caching it for each combination of qualifiers
+
+    Args:
+        qualifiers (Tuple[str, ...]): the qualifiers of an annotation
+    Returns:
+        str: the sorted relation labels of the qualifiers joined by underscores
+    """
+    try:
+        return "_".join(sorted([relations.lookup_uri(curie_util.expand_uri(qualifier, strict=False))
+                                for qualifier in qualifiers]))
+    except AttributeError:
+        return "_".join(sorted(qualifiers))
+
+
 class ModuleSentences(object):
     def __init__(self, sentences):
         self.sentences = sentences
@@ -24,30 +45,33 @@ class ModuleSentences(object):
         return ". ".join([sentence.text[0].upper() + sentence.text[1:] for sentence in self.sentences])
 
     def get_ids(self, experimental_only: bool = False):
-        return list({term_id for sentence in self.sentences for term_id in sentence.terms_ids if not experimental_only or
-                     sentence.evidence_group.startswith("EXPERIMENTAL")})
+        return list(set().union(*(sentence.terms_ids for sentence in self.sentences if not experimental_only or
+                                  sentence.evidence_group.startswith("EXPERIMENTAL"))))
 
     def get_initial_ids(self, experimental_only: bool = False):
-        return list({term_id for sentence in self.sentences for term_id in sentence.initial_terms_ids if not
-                     experimental_only or sentence.evidence_group.startswith("EXPERIMENTAL")})
+        return list(set().union(*(sentence.initial_terms_ids for sentence in self.sentences if not experimental_only
+                                  or sentence.evidence_group.startswith("EXPERIMENTAL"))))
 
     def contains_sentences(self):
         return len(self.sentences) > 0
 
 
 class SentenceMerger(object):
-    def __init__(self):
-        self.initial_terms_ids = set()
-        self.postfix_list = []
-        self.terms_ids = set()
-        self.term_postfix_dict = {}
-        self.evidence_groups = []
-        self.term_evgroup_dict = {}
-        self.additional_prefix = ""
-        self.aspect = ""
-        self.qualifier = ""
-        self.ancestors_covering_multiple_terms = set()
-        self.any_trimmed = False
+    __slots__ = ("initial_terms_ids", "postfix_list", "terms_ids", "evidence_groups", "additional_prefix", "aspect",
+                 "qualifier", "ancestors_covering_multiple_terms", "any_trimmed")
+
+    def __init__(self, initial_terms_ids: Set[str], postfix_list: List[str], terms_ids: Set[str],
+                 evidence_groups: List[str], additional_prefix: str, aspect: str, qualifier: str,
+                 ancestors_covering_multiple_terms: Set[str], any_trimmed: bool):
+        self.initial_terms_ids = initial_terms_ids
+        self.postfix_list = postfix_list
+        self.terms_ids = terms_ids
+        self.evidence_groups = evidence_groups
+        self.additional_prefix = additional_prefix
+        self.aspect = aspect
+        self.qualifier = qualifier
+        self.ancestors_covering_multiple_terms = ancestors_covering_multiple_terms
+        self.any_trimmed = any_trimmed
 
 
 class OntologySentenceGenerator(object):
@@ -65,7 +89,29 @@ class OntologySentenceGenerator(object):
         self.config = config
         self.module = module
         self.terms_already_covered = set()
-        self.terms_groups = defaultdict(lambda: defaultdict(set))
+        self.terms_groups = defaultdict(partial(defaultdict, set))
+        self.ancestors_cache = {}
+        self.labels_cache = {}
+        self.exclude_terms = frozenset(config.get_module_property(module=module,
+                                                                  prop=ConfigModuleProperty.EXCLUDE_TERMS) or [])
+        self.remove_overlap = config.get_module_property(module=module, prop=ConfigModuleProperty.REMOVE_OVERLAP)
+        self.del_parents_if_child = config.get_module_property(module=module,
+                                                               prop=ConfigModuleProperty.DEL_PARENTS_IF_CHILD)
+        self.del_children_if_parent = config.get_module_property(module=module,
+                                                                 prop=ConfigModuleProperty.DEL_CHILDREN_IF_PARENT)
+        self.max_num_terms = config.get_module_property(module=module,
+                                                        prop=ConfigModuleProperty.MAX_NUM_TERMS_IN_SENTENCE)
+        self.distance_from_root = config.get_module_property(module=module,
+                                                             prop=ConfigModuleProperty.DISTANCE_FROM_ROOT)
+        self.do_not_trim_branch_at = config.get_module_property(module=module,
+                                                                prop=ConfigModuleProperty.DO_NOT_TRIM_BRANCH_AT)
+        self.rename_cell = config.get_module_property(module=module, prop=ConfigModuleProperty.RENAME_CELL)
+        self.add_multiple_to_common_ancestors = config.get_module_property(
+            module=module, prop=ConfigModuleProperty.ADD_MULTIPLE_TO_COMMON_ANCEST)
+        self.cutoff_several_word = config.get_module_property(module=module,
+                                                              prop=ConfigModuleProperty.CUTOFF_SEVERAL_WORD)
+        self.cutoff_several_category_word = config.get_module_property(
+            module=module, prop=ConfigModuleProperty.CUTOFF_SEVERAL_CATEGORY_WORD)
         self.evidence_groups_priority_list = config.get_evidence_groups_priority_list(module=module)
         self.prepostfix_sentences_map = config.get_prepostfix_sentence_map(module=module, humans=humans)
         self.gene_annots = data_manager.get_annotations_for_gene(
@@ -74,39 +120,67 @@ class OntologySentenceGenerator(object):
         self.trimmer = CONF_TO_TRIMMING_CLASS[config.get_module_property(
             module=module, prop=ConfigModuleProperty.TRIMMING_ALGORITHM)](
             ontology=self.ontology, annotations=data_manager.get_associations(get_data_type_from_module(module)),
-            nodeids_blacklist=config.get_module_property(module=module, prop=ConfigModuleProperty.EXCLUDE_TERMS),
+            nodeids_blacklist=self.exclude_terms,
             slim_terms_ic_bonus_perc=config.get_module_property(module=module, prop=ConfigModuleProperty.SLIM_BONUS_PERC),
             slim_set=data_manager.get_slim(module=module))
         self.set_terms_groups(module, config, limit_to_group, humans)
 
+    def get_ancestors(self, term_id: str) -> FrozenSet[str]:
+        """get the ancestors of a term, caching them for the lifetime of the generator
+
+        Args:
+            term_id (str): the id of the term
+        Returns:
+            FrozenSet[str]: the ids of the ancestors of the term
+        """
+        if term_id not in self.ancestors_cache:
+            self.ancestors_cache[term_id] = frozenset(self.ontology.ancestors(term_id))
+        return self.ancestors_cache[term_id]
+
+    def get_label(self, term_id: str) -> str:
+        """get the label of a term, or its id if the label is not set, caching it for the lifetime of the generator
+
+        Args:
+            term_id (str): the id of the term
+        Returns:
+            str: the label of the term
+        """
+        if term_id not in self.labels_cache:
+            self.labels_cache[term_id] = self.ontology.label(term_id, id_if_null=True)
+        return self.labels_cache[term_id]
+
     def set_terms_groups(self, module, config, limit_to_group, humans):
         ev_codes_groups_maps = config.get_evidence_codes_groups_map(module=module)
-        evidence_codes_groups_map = {evcode: group for evcode, group in ev_codes_groups_maps.items() if
-                                     limit_to_group is None or limit_to_group in ev_codes_groups_maps[evcode]}
-        prepostfix_special_cases_sent_map = config.get_prepostfix_sentence_map(module=module, special_cases_only=True,
-                                                                               humans=humans)
-        if len(self.gene_annots) > 0:
-            for annotation in self.gene_annots:
-                if annotation["evidence"]["type"] in evidence_codes_groups_map:
-                    aspect = annotation["aspect"]
-                    ev_group = evidence_codes_groups_map[annotation["evidence"]["type"]]
-                    try:
-                        qualifier = "_".join(sorted([relations.lookup_uri(curie_util.expand_uri(str(q), strict=False))
-                                                     for q in annotation["qualifiers"]])) if "qualifiers" in \
-                                                                                             annotation else ""
-                    except AttributeError:
-                        qualifier = "_".join(sorted(annotation["qualifiers"])) if "qualifiers" in annotation else ""
-                    if prepostfix_special_cases_sent_map and aspect + "|" + ev_group + "|" + qualifier in \
-                       prepostfix_special_cases_sent_map:
-                        for special_case in prepostfix_special_cases_sent_map[aspect + "|" + ev_group + "|" + qualifier]:
-                            if re.match(special_case[1], self.ontology.label(annotation["object"]["id"], id_if_null=True)):
-                                ev_group = evidence_codes_groups_map[annotation["evidence"]["type"]] + \
-                                           str(special_case[0])
-                                if ev_group not in self.evidence_groups_priority_list:
-                                    self.evidence_groups_priority_list.insert(self.evidence_groups_priority_list.index(
-                                        evidence_codes_groups_map[annotation["evidence"]["type"]]) + 1, ev_group)
-                                break
-                    self.terms_groups[(aspect, qualifier)][ev_group].add(annotation["object"]["id"])
+        if limit_to_group is None:
+            evidence_codes_groups_map = ev_codes_groups_maps
+        else:
+            evidence_codes_groups_map = {evcode: group for evcode, group in ev_codes_groups_maps.items() if
+                                         limit_to_group in group}
+        special_cases_patterns = config.get_special_cases_patterns(module=module)
+        groups_with_priority = set(self.evidence_groups_priority_list)
+        for annotation in self.gene_annots:
+            base_ev_group = evidence_codes_groups_map.get(annotation["evidence"]["type"])
+            if base_ev_group is None:
+                continue
+            aspect = annotation["aspect"]
+            term_id = annotation["object"]["id"]
+            ev_group = base_ev_group
+            qualifier = _get_qualifier_key(tuple(str(q) for q in annotation["qualifiers"])) if "qualifiers" in \
+                annotation else ""
+            if (aspect, ev_group, qualifier) in special_cases_patterns:
+                term_label = self.get_label(term_id)
+                for special_case_id, special_case_pattern, special_case_regex in special_cases_patterns[
+                        (aspect, ev_group, qualifier)]:
+                    if special_case_regex.match(term_label) if special_case_regex else term_label.startswith(
+                            special_case_pattern):
+                        ev_group = base_ev_group + str(special_case_id)
+                        if ev_group not in groups_with_priority:
+                            self.evidence_groups_priority_list.insert(self.evidence_groups_priority_list.index(
+                                base_ev_group) + 1, ev_group)
+                            groups_with_priority.add(ev_group)
+                        break
+            self.terms_groups[(aspect, qualifier)][ev_group].add(term_id)
+        self.evidence_group_priority = {eg: p for p, eg in enumerate(self.evidence_groups_priority_list)}
 
     def get_module_sentences(self, aspect: str, qualifier: str = '',
                              keep_only_best_group: bool = False, merge_groups_with_same_prefix: bool = False):
@@ -123,19 +197,14 @@ class OntologySentenceGenerator(object):
             ModuleSentences: the module sentences
         """
         sentences = []
-        evidence_group_priority = {eg: p for p, eg in enumerate(self.evidence_groups_priority_list)}
-        rename_cell = self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.RENAME_CELL)
-        dist_root = self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.DISTANCE_FROM_ROOT)
-        add_mul_comanc = self.config.get_module_property(module=self.module,
-                                                         prop=ConfigModuleProperty.ADD_MULTIPLE_TO_COMMON_ANCEST)
         best_group = ""
-        for terms, evidence_group, priority in sorted([(t, eg, evidence_group_priority[eg]) for eg, t in
-                                                       self.terms_groups[(aspect, qualifier)].items()],
-                                                      key=lambda x: x[2]):
+        for _, evidence_group, terms in sorted((self.evidence_group_priority[eg], eg, t) for eg, t in
+                                               self.terms_groups[(aspect, qualifier)].items()):
             if not best_group or re.match(best_group + r"([0-9]*)?", evidence_group):
-                trimming_result = self.reduce_num_terms(terms=terms, min_distance_from_root=dist_root[aspect])
-                if aspect + "|" + evidence_group + "|" + qualifier in self.prepostfix_sentences_map \
-                        and len(trimming_result.final_terms) > 0:
+                trimming_result = self.reduce_num_terms(terms=terms,
+                                                        min_distance_from_root=self.distance_from_root[aspect])
+                if len(trimming_result.final_terms) > 0 and (aspect, evidence_group, qualifier) in \
+                        self.prepostfix_sentences_map:
                     sentences.append(
                         _get_single_sentence(
                             initial_terms_ids=list(terms),
@@ -144,26 +213,22 @@ class OntologySentenceGenerator(object):
                             prepostfix_sentences_map=self.prepostfix_sentences_map,
                             terms_merged=False, trimmed=trimming_result.trimming_applied,
                             add_others=trimming_result.partial_coverage,
-                            truncate_others_generic_word=self.config.get_module_property(
-                                module=self.module, prop=ConfigModuleProperty.CUTOFF_SEVERAL_WORD),
-                            truncate_others_aspect_words=self.config.get_module_property(
-                                module=self.module, prop=ConfigModuleProperty.CUTOFF_SEVERAL_CATEGORY_WORD),
-                            ancestors_with_multiple_children=trimming_result.multicovering_nodes if add_mul_comanc else
-                            None, rename_cell=rename_cell, config=self.config,
+                            truncate_others_generic_word=self.cutoff_several_word,
+                            truncate_others_aspect_words=self.cutoff_several_category_word,
+                            ancestors_with_multiple_children=trimming_result.multicovering_nodes if
+                            self.add_multiple_to_common_ancestors else None, rename_cell=self.rename_cell,
+                            config=self.config,
                             put_anatomy_male_at_end=True if aspect == 'A' else False))
                     if keep_only_best_group and not best_group:
                         best_group = evidence_group
         if merge_groups_with_same_prefix:
-            remove_parents = self.config.get_module_property(module=self.module,
-                                                             prop=ConfigModuleProperty.DEL_PARENTS_IF_CHILD)
             sentences = self.merge_sentences_with_same_prefix(
-                sentences=sentences, remove_parent_terms=remove_parents, rename_cell=rename_cell,
+                sentences=sentences, remove_parent_terms=self.del_parents_if_child, rename_cell=self.rename_cell,
                 put_anatomy_male_at_end=True if aspect == 'A' else False)
         return ModuleSentences(sentences)
 
     def separate_do_not_trim_from_trim_terms(self, term_ids: List[str]):
-        branch_root_ids = self.config.get_module_property(module=self.module,
-                                                          prop=ConfigModuleProperty.DO_NOT_TRIM_BRANCH_AT)
+        branch_root_ids = self.do_not_trim_branch_at
         if branch_root_ids:
             do_not_trim_terms = []
             trim_terms = []
@@ -189,19 +254,17 @@ class OntologySentenceGenerator(object):
             TrimmingResult: the reduced set of terms with additional information on the nature of the terms
         """
         trimming_result = TrimmingResult()
-        if self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.REMOVE_OVERLAP):
-            terms -= self.terms_already_covered
-        exclude_terms = self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.EXCLUDE_TERMS)
-        if exclude_terms:
-            terms -= set(exclude_terms)
-        if self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.DEL_PARENTS_IF_CHILD):
+        if self.remove_overlap:
+            terms.difference_update(self.terms_already_covered, self.exclude_terms)
+        else:
+            terms.difference_update(self.exclude_terms)
+        if self.del_parents_if_child:
             terms = OntologySentenceGenerator.remove_parents_if_child_present(terms, self.ontology,
-                                                                              self.terms_already_covered)
-        max_terms = self.config.get_module_property(module=self.module,
-                                                    prop=ConfigModuleProperty.MAX_NUM_TERMS_IN_SENTENCE)
-        if 0 < max_terms < len(terms):
+                                                                              self.terms_already_covered,
+                                                                              get_ancestors=self.get_ancestors)
+        if 0 < self.max_num_terms < len(terms):
             do_not_trim_terms, trim_terms = self.separate_do_not_trim_from_trim_terms(term_ids=terms)
-            trimming_result = self.trimmer.trim(trim_terms, max_terms, min_distance_from_root)
+            trimming_result = self.trimmer.trim(trim_terms, self.max_num_terms, min_distance_from_root)
             if do_not_trim_terms:
                 trimming_result.final_terms.extend(do_not_trim_terms)
                 trimming_result.covered_nodes.update(do_not_trim_terms)
@@ -209,40 +272,53 @@ class OntologySentenceGenerator(object):
             trimming_result.final_terms = terms
             trimming_result.covered_nodes = terms
         self.terms_already_covered.update(terms)
-        if self.config.get_module_property(module=self.module, prop=ConfigModuleProperty.DEL_CHILDREN_IF_PARENT):
+        if self.del_children_if_parent:
             trimming_result.final_terms = self.remove_children_if_parents_present(
                 terms=trimming_result.final_terms, ontology=self.ontology,
                 terms_already_covered=self.terms_already_covered,
-                ancestors_covering_multiple_children=trimming_result.multicovering_nodes)
+                ancestors_covering_multiple_children=trimming_result.multicovering_nodes,
+                get_ancestors=self.get_ancestors, get_label=self.get_label)
         return trimming_result
 
     @staticmethod
     def remove_children_if_parents_present(terms, ontology, terms_already_covered: Set[str] = None,
-                                           ancestors_covering_multiple_children: Set[str] = None):
+                                           ancestors_covering_multiple_children: Set[str] = None,
+                                           get_ancestors: Callable[[str], Iterable[str]] = None,
+                                           get_label: Callable[[str], str] = None):
+        if get_ancestors is None:
+            get_ancestors = ontology.ancestors
+        if get_label is None:
+            def get_label(term_id):
+                return ontology.label(term_id, id_if_null=True)
+        terms_set = set(terms)
         terms_nochildren = []
         for term in terms:
-            if len(set(ontology.ancestors(term)).intersection(set(terms))) == 0:
+            term_ancestors = get_ancestors(term)
+            if terms_set.isdisjoint(term_ancestors):
                 terms_nochildren.append(term)
             elif ancestors_covering_multiple_children is not None:
-                ancestors_covering_multiple_children.update({ontology.label(term_id, id_if_null=True) for term_id in
-                                                             set(ontology.ancestors(term)).intersection(set(terms))})
+                ancestors_covering_multiple_children.update({get_label(term_id) for term_id in
+                                                             terms_set.intersection(term_ancestors)})
         if len(terms_nochildren) < len(terms):
             if terms_already_covered is not None:
-                terms_already_covered.update(set(terms) - set(terms_nochildren))
+                terms_already_covered.update(terms_set.difference(terms_nochildren))
             logger.debug("Removed " + str(len(terms) - len(terms_nochildren)) + " children from terms")
             return terms_nochildren
         else:
             return terms
 
     @staticmethod
-    def remove_parents_if_child_present(terms, ontology, terms_already_covered: Set[str] = None):
-        terms_no_ancestors = list(set(terms) - set([ancestor for node_id in terms for ancestor in
-                                                    ontology.ancestors(node_id)]))
+    def remove_parents_if_child_present(terms, ontology, terms_already_covered: Set[str] = None,
+                                        get_ancestors: Callable[[str], Iterable[str]] = None):
+        if get_ancestors is None:
+            get_ancestors = ontology.ancestors
+        terms_set = set(terms)
+        terms_no_ancestors = terms_set.difference(*(get_ancestors(node_id) for node_id in terms_set))
         if len(terms) > len(terms_no_ancestors):
             if terms_already_covered is not None:
-                terms_already_covered.update(set(terms) - set(terms_no_ancestors))
+                terms_already_covered.update(terms_set - terms_no_ancestors)
             logger.debug("Removed " + str(len(terms) - len(terms_no_ancestors)) + " parents from terms")
-            return terms_no_ancestors
+            return list(terms_no_ancestors)
         else:
             return terms
 
@@ -258,52 +334,54 @@ class OntologySentenceGenerator(object):
         Returns:
             List[Sentence]: the list of merged sentences, sorted by (merged) evidence group priority
         """
-        merged_sentences = defaultdict(SentenceMerger)
+        terms_sets = [set(sentence.terms_ids) for sentence in sentences]
+        if len({sentence.prefix for sentence in sentences}) == len(sentences) and (not remove_parent_terms or all(
+                terms_set.isdisjoint(self.get_ancestors(term)) for terms_set in terms_sets for term in terms_set)):
+            # nothing to merge or to remove, and the sentences have already been composed with the same options. Flag
+            # them as merged, as the full merge below would do
+            return [dataclasses.replace(sentence, terms_merged=True) for sentence in sentences if sentence.terms_ids]
+        sentences_by_prefix = defaultdict(list)
         for sentence in sentences:
-            prefix = self.prepostfix_sentences_map[sentence.aspect + "|" + sentence.evidence_group + "|" + sentence.qualifier][0]
-            merged_sentences[prefix].postfix_list.append(self.prepostfix_sentences_map[sentence.aspect + "|" +
-                                                                                       sentence.evidence_group + "|" +
-                                                                                       sentence.qualifier][1])
-            merged_sentences[prefix].aspect = sentence.aspect
-            merged_sentences[prefix].qualifier = sentence.qualifier
-            merged_sentences[prefix].terms_ids.update(sentence.terms_ids)
-            merged_sentences[prefix].initial_terms_ids.update(sentence.initial_terms_ids)
-            for term in sentence.terms_ids:
-                merged_sentences[prefix].term_postfix_dict[term] = self.prepostfix_sentences_map[
-                    sentence.aspect + "|" + sentence.evidence_group + "|" + sentence.qualifier][1]
-            merged_sentences[prefix].evidence_groups.append(sentence.evidence_group)
-            for term in sentence.terms_ids:
-                merged_sentences[prefix].term_evgroup_dict[term] = sentence.evidence_group
-            if sentence.additional_prefix:
-                merged_sentences[prefix].additional_prefix = sentence.additional_prefix
-            merged_sentences[prefix].ancestors_covering_multiple_terms.update(
-                sentence.ancestors_covering_multiple_terms)
-            merged_sentences[prefix].any_trimmed = merged_sentences[prefix].any_trimmed or sentence.trimmed
+            sentences_by_prefix[sentence.prefix].append(sentence)
+        merged_sentences = {}
+        for prefix, prefix_sentences in sentences_by_prefix.items():
+            merged_sentences[prefix] = SentenceMerger(
+                initial_terms_ids=set().union(*(sentence.initial_terms_ids for sentence in prefix_sentences)),
+                postfix_list=[sentence.postfix for sentence in prefix_sentences],
+                terms_ids=set().union(*(sentence.terms_ids for sentence in prefix_sentences)),
+                evidence_groups=[sentence.evidence_group for sentence in prefix_sentences],
+                additional_prefix=next((sentence.additional_prefix for sentence in reversed(prefix_sentences)
+                                        if sentence.additional_prefix), ""),
+                aspect=prefix_sentences[-1].aspect, qualifier=prefix_sentences[-1].qualifier,
+                ancestors_covering_multiple_terms=set().union(
+                    *(sentence.ancestors_covering_multiple_terms for sentence in prefix_sentences)),
+                any_trimmed=any(sentence.trimmed for sentence in prefix_sentences))
         if remove_parent_terms:
             for prefix, sent_merger in merged_sentences.items():
-                terms_no_ancestors = sent_merger.terms_ids - set([ancestor for node_id in sent_merger.terms_ids for
-                                                                  ancestor in self.ontology.ancestors(node_id)])
+                terms_no_ancestors = sent_merger.terms_ids.difference(*(self.get_ancestors(node_id) for node_id in
+                                                                        sent_merger.terms_ids))
                 if len(sent_merger.terms_ids) > len(terms_no_ancestors):
                     logger.debug("Removed " + str(len(sent_merger.terms_ids) - len(terms_no_ancestors)) +
                                  " parents from terms while merging sentences with same prefix")
                     sent_merger.terms_ids = terms_no_ancestors
-        return [Sentence(prefix=prefix, initial_terms_ids=list(sent_merger.initial_terms_ids),
-                         terms_ids=list(sent_merger.terms_ids),
-                         postfix=OntologySentenceGenerator.merge_postfix_phrases(sent_merger.postfix_list),
-                         text=compose_sentence(prefix=prefix,
-                                               term_names=[self.ontology.label(node, id_if_null=True) for node in
-                                                           sent_merger.terms_ids],
-                                               postfix=OntologySentenceGenerator.merge_postfix_phrases(
-                                                   sent_merger.postfix_list),
-                                               additional_prefix=sent_merger.additional_prefix,
-                                               ancestors_with_multiple_children=sent_merger.ancestors_covering_multiple_terms,
-                                               rename_cell=rename_cell, config=self.config,
-                                               put_anatomy_male_at_end=put_anatomy_male_at_end),
-                         aspect=sent_merger.aspect, evidence_group=", ".join(sent_merger.evidence_groups),
-                         terms_merged=True, trimmed=sent_merger.any_trimmed,
-                         additional_prefix=sent_merger.additional_prefix, qualifier=sent_merger.qualifier,
-                         ancestors_covering_multiple_terms=sent_merger.ancestors_covering_multiple_terms)
-                for prefix, sent_merger in merged_sentences.items() if len(sent_merger.terms_ids) > 0]
+        final_sentences = []
+        for prefix, sent_merger in merged_sentences.items():
+            if len(sent_merger.terms_ids) > 0:
+                postfix = OntologySentenceGenerator.merge_postfix_phrases(sent_merger.postfix_list)
+                final_sentences.append(Sentence(
+                    prefix=prefix, initial_terms_ids=list(sent_merger.initial_terms_ids),
+                    terms_ids=list(sent_merger.terms_ids), postfix=postfix,
+                    text=compose_sentence(prefix=prefix,
+                                          term_names=[self.get_label(node) for node in sent_merger.terms_ids],
+                                          postfix=postfix, additional_prefix=sent_merger.additional_prefix,
+                                          ancestors_with_multiple_children=sent_merger.ancestors_covering_multiple_terms,
+                                          rename_cell=rename_cell, config=self.config,
+                                          put_anatomy_male_at_end=put_anatomy_male_at_end),
+                    aspect=sent_merger.aspect, evidence_group=", ".join(sent_merger.evidence_groups),
+                    terms_merged=True, trimmed=sent_merger.any_trimmed,
+                    additional_prefix=sent_merger.additional_prefix, qualifier=sent_merger.qualifier,
+                    ancestors_covering_multiple_terms=sent_merger.ancestors_covering_multiple_terms))
+        return final_sentences
 
     @staticmethod
     def merge_postfix_phrases(postfix_phrases: List[str]) -> str:
@@ -316,24 +394,12 @@ class OntologySentenceGenerator(object):
         """
         postfix_phrases = [postfix for postfix in postfix_phrases if postfix]
         if postfix_phrases and len(postfix_phrases) > 0:
-            if len(postfix_phrases) > 1:
-                inf_engine = inflect.engine()
-                shortest_phrase = sorted(zip(postfix_phrases, [len(phrase) for phrase in postfix_phrases]),
-                                         key=lambda x: x[1])[0][0]
-                first_part = ""
-                for idx, letter in enumerate(shortest_phrase):
-                    if all(map(lambda x: x[idx] == shortest_phrase[idx], postfix_phrases)):
-                        first_part += letter
-                    else:
-                        break
-                last_part = ""
-                for idx, letter in zip(range(len(shortest_phrase)), reversed([l for l in shortest_phrase])):
-                    if all(map(lambda x: x[len(x) - idx - 1] == shortest_phrase[len(shortest_phrase) - idx - 1],
-                               postfix_phrases)):
-                        last_part = letter + last_part
-                    else:
-                        break
-                new_phrases = [phrase.replace(first_part, "").replace(last_part, "") for phrase in postfix_phrases]
+            if len(set(postfix_phrases)) > 1:
+                inf_engine = get_inflect_engine()
+                first_part = os.path.commonprefix(postfix_phrases)
+                last_part = os.path.commonprefix([phrase[len(first_part):][::-1] for phrase in
+                                                  postfix_phrases])[::-1]
+                new_phrases = [phrase[len(first_part):len(phrase) - len(last_part)] for phrase in postfix_phrases]
                 if len(last_part.strip().split(" ")) == 1:
                     last_part = inf_engine.plural(last_part)
                 if len(new_phrases) > 2:
@@ -346,3 +412,73 @@ class OntologySentenceGenerator(object):
                 return postfix_phrases[0]
         else:
             return ""
+
+
+def _get_gene_module_sentences(gene_id: str, module: Module, data_manager: DataManager, config: GenedescConfigParser,
+                               aspects_qualifiers: List[Tuple[str, str]], limit_to_group: str = None,
+                               humans: bool = False, keep_only_best_group: bool = False,
+                               merge_groups_with_same_prefix: bool = False) \
+        -> Tuple[str, Dict[Tuple[str, str], ModuleSentences]]:
+    sentence_generator = OntologySentenceGenerator(gene_id=gene_id, module=module, data_manager=data_manager,
+                                                   config=config, limit_to_group=limit_to_group, humans=humans)
+    return gene_id, {(aspect, qualifier): sentence_generator.get_module_sentences(
+        aspect=aspect, qualifier=qualifier, keep_only_best_group=keep_only_best_group,
+        merge_groups_with_same_prefix=merge_groups_with_same_prefix) for aspect, qualifier in aspects_qualifiers}
+
+
+_worker_get_gene_module_sentences = None
+
+
+def _init_module_sentences_worker(module: Module, data_manager: DataManager, config: GenedescConfigParser,
+                                  aspects_qualifiers: List[Tuple[str, str]], limit_to_group: str, humans: bool,
+                                  keep_only_best_group: bool, merge_groups_with_same_prefix: bool):
+    # runs in each worker process only, binding the shared arguments once per worker instead of once per gene
+    global _worker_get_gene_module_sentences
+    _worker_get_gene_module_sentences = partial(
+        _get_gene_module_sentences, module=module, data_manager=data_manager, config=config,
+        aspects_qualifiers=aspects_qualifiers, limit_to_group=limit_to_group, humans=humans,
+        keep_only_best_group=keep_only_best_group, merge_groups_with_same_prefix=merge_groups_with_same_prefix)
+
+
+def _get_gene_module_sentences_in_worker(gene_id: str):
+    return _worker_get_gene_module_sentences(gene_id)
+
+
+def generate_module_sentences_parallel(gene_ids: Iterable[str], module: Module, data_manager: DataManager,
+                                       config: GenedescConfigParser, aspects_qualifiers: List[Tuple[str, str]],
+                                       limit_to_group: str = None, humans: bool = False,
+                                       keep_only_best_group: bool = False, merge_groups_with_same_prefix: bool = False,
+                                       max_workers: int = None, chunksize: int = 32, mp_context=None) \
+        -> Dict[str, Dict[Tuple[str, str], ModuleSentences]]:
+    """generate module sentences for multiple genes in parallel worker processes
+
+    The data manager and the configuration are handed to each worker once, through the pool initializer. With the
+    fork start method (the default where available) they are inherited by the workers and shared copy-on-write with
+    the parent process; with other start methods they are pickled once per worker. For each gene, the combinations of
+    aspect and qualifier are processed in the provided order by the same sentence generator, as in a sequential run
+
+    Args:
+        gene_ids (Iterable[str]): the ids of the genes to process
+        module (Module): the description module
+        data_manager (DataManager): the data manager containing ontologies and annotations
+        config (GenedescConfigParser): configuration object where to read properties
+        aspects_qualifiers (List[Tuple[str, str]]): the (aspect, qualifier) pairs for which to generate sentences
+        limit_to_group (str): limit the evidence codes to the specified group
+        humans (bool): whether to use the sentence map for humans
+        keep_only_best_group (bool): whether to get only the evidence group with highest priority
+        merge_groups_with_same_prefix (bool): whether to merge the phrases for evidence groups with the same prefix
+        max_workers (int): number of worker processes. Default to the number of cpus
+        chunksize (int): number of genes sent to a worker at a time
+        mp_context: the multiprocessing context used to start the workers. Default to fork where available, otherwise
+            to the platform default
+    Returns:
+        Dict[str, Dict[Tuple[str, str], ModuleSentences]]: the module sentences of each gene, indexed by gene id and
+            by (aspect, qualifier)
+    """
+    if mp_context is None and "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                             initializer=_init_module_sentences_worker,
+                             initargs=(module, data_manager, config, aspects_qualifiers, limit_to_group, humans,
+                                       keep_only_best_group, merge_groups_with_same_prefix)) as executor:
+        return dict(executor.map(_get_gene_module_sentences_in_worker, gene_ids, chunksize=chunksize))
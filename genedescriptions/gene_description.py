@@ -1,8 +1,6 @@
-import inflect
-
 from typing import List
 
-from genedescriptions.commons import Module, Sentence
+from genedescriptions.commons import Module, Sentence, get_inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser
 from genedescriptions.descriptions_generator import OntologySentenceGenerator, ModuleSentences
 from genedescriptions.sentence_generation_functions import concatenate_words_with_oxford_comma
@@ -56,10 +54,7 @@ class GeneDescription(object):
 
     @staticmethod
     def _get_merged_ids(ids, ids_destination):
-        if len(ids_destination) > 0:
-            return list(set().union(set(ids_destination), set(ids)))
-        else:
-            return list(set(ids))
+        return list(set(ids_destination).union(ids))
 
     def set_or_extend_module_description_and_final_stats(self, module: Module,
                                                          module_sentences: ModuleSentences = None,
@@ -88,13 +83,12 @@ class GeneDescription(object):
             desc = module_sentences.get_description()
             self.stats.trimmed = self.stats.trimmed or any([sent.trimmed for sent in module_sentences.sentences])
         elif description:
-            inflect_engine = inflect.engine()
             desc = description
             if additional_postfix_terms_list and len(additional_postfix_terms_list) > 0:
                 desc += " " + concatenate_words_with_oxford_comma(additional_postfix_terms_list,
                                                                   separator=self.config.get_terms_delimiter()) + " " + \
                         (additional_postfix_final_word if use_single_form or len(additional_postfix_terms_list) == 1
-                         else inflect_engine.plural_noun(additional_postfix_final_word))
+                         else get_inflect_engine().plural_noun(additional_postfix_final_word))
         if desc:
             if self.description and self.description != self.gene_name:
                 if self.config.get_modules_delimiter() == ".":
@@ -54,6 +54,9 @@ def get_all_common_ancestors(node_ids: List[str], ontology: Ontology, min_distan
     common_root = nodes_have_same_root(node_ids=node_ids, ontology=ontology)
     if common_root is False:
         raise ValueError("Cannot get common ancestors of nodes connected to different roots")
+    node_ids_set = set(node_ids)
+    if nodeids_blacklist:
+        nodeids_blacklist = frozenset(nodeids_blacklist)
     ancestors = defaultdict(list)
     for node_id in node_ids:
         for ancestor in ontology.ancestors(node=node_id, reflexive=True):
@@ -63,7 +66,7 @@ def get_all_common_ancestors(node_ids: List[str], ontology: Ontology, min_distan
                 for basic_prop_val in onto_anc["meta"]["basicPropertyValues"]:
                     if basic_prop_val["pred"] == "OIO:hasOBONamespace":
                         onto_anc_root = basic_prop_val["val"]
-            if (ancestor in node_ids or onto_anc["depth"] >= min_distance_from_root) and (
+            if (ancestor in node_ids_set or onto_anc["depth"] >= min_distance_from_root) and (
                 not onto_anc_root or onto_anc_root == common_root) and (not nodeids_blacklist or ancestor not in
                                                                         nodeids_blacklist):
                 ancestors[ancestor].append(node_id)
@@ -27,7 +27,7 @@ def find_set_covering(subsets: List[CommonAncestor], ontology: Ontology = None,
     elem_to_process = {subset.node_id for subset in subsets}
     if value and len(value) != len(elem_to_process):
         return None
-    universe = set([e for subset in subsets for e in subset.covered_starting_nodes])
+    universe = set().union(*(subset.covered_starting_nodes for subset in subsets))
     included_elmts = set()
     included_sets = []
     while len(elem_to_process) > 0 and included_elmts != universe and (not max_num_subsets or len(included_sets) <
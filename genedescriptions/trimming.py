@@ -19,7 +19,7 @@ class TrimmingAlgorithm(metaclass=ABCMeta):
                  slim_terms_ic_bonus_perc: int = 0, slim_set: set = None):
         self.ontology = ontology
         self.annotations = annotations
-        self.nodeids_blacklist = nodeids_blacklist
+        self.nodeids_blacklist = frozenset(nodeids_blacklist) if nodeids_blacklist else None
         self.slim_terms_ic_bonus_perc = slim_terms_ic_bonus_perc
         self.slim_set = slim_set
 
@@ -34,3 +34,25 @@ class TestConfigParser(unittest.TestCase):
 
     def test_evidence_codes(self):
         self.assertTrue("EXP" in list(self.conf_parser.get_evidence_codes_groups_map(module=Module.GO).keys()))
+
+    def test_prepostfix_sentence_map(self):
+        prepost_map = self.conf_parser.get_prepostfix_sentence_map(module=Module.GO)
+        self.assertTrue(all(isinstance(key, tuple) and len(key) == 3 for key in prepost_map.keys()))
+        self.assertEqual(prepost_map[("F", "EXPERIMENTAL", "")], ("exhibits", ""))
+        self.assertEqual(prepost_map[("F", "EXPERIMENTAL", "contributes_to")], ("contributes to", ""))
+        # special cases are indexed by the evidence group followed by their id
+        self.assertEqual(prepost_map[("F", "EXPERIMENTAL1", "")], ("is a", ""))
+        special_cases_map = self.conf_parser.get_prepostfix_sentence_map(module=Module.GO, special_cases_only=True)
+        self.assertEqual(special_cases_map[("F", "EXPERIMENTAL", "")], [(1, "structural constituent", "is a", "")])
+        self.assertEqual(self.conf_parser.get_prepostfix_sentence_map(module=Module.DO_EXPERIMENTAL, humans=True),
+                         {("D", "EXPERIMENTAL", ""): ("is implicated in", "")})
+
+    def test_special_cases_patterns(self):
+        special_cases_patterns = self.conf_parser.get_special_cases_patterns(module=Module.GO)
+        self.assertIs(special_cases_patterns, self.conf_parser.get_special_cases_patterns(module=Module.GO))
+        special_case_id, pattern, compiled_pattern = special_cases_patterns[("F", "EXPERIMENTAL", "")][0]
+        self.assertEqual((special_case_id, pattern, compiled_pattern), (1, "structural constituent", None))
+        special_case_id, pattern, compiled_pattern = special_cases_patterns[("C", "EXPERIMENTAL", "")][0]
+        self.assertEqual(pattern, "intracellular$")
+        self.assertTrue(compiled_pattern.match("intracellular"))
+        self.assertFalse(compiled_pattern.match("intracellular membrane-bounded organelle"))
@@ -1,4 +1,5 @@
 import logging
+import tempfile
 import unittest
 import os
 
@@ -58,6 +59,26 @@ class TestGOModule(unittest.TestCase):
                                                  self.this_dir, "data", "c_elegans.PRJNA13758.WS273.geneIDs.txt.gz"))
         self.assertTrue(test_file == os.path.join(self.this_dir, "cache", "c_elegans.PRJNA13758.WS273.geneIDs.txt"))
 
+    def test_prefetch_files(self):
+        with tempfile.TemporaryDirectory() as prefetch_dir:
+            gz_cache_path = os.path.join(prefetch_dir, "c_elegans.PRJNA13758.WS273.geneIDs.txt.gz")
+            obo_cache_path = os.path.join(prefetch_dir, "doid.obo")
+            self.df.prefetch_files([
+                ("file://" + os.path.join(self.this_dir, "data", "c_elegans.PRJNA13758.WS273.geneIDs.txt.gz"),
+                 gz_cache_path),
+                ("file://" + os.path.join(self.this_dir, "data", "doid.obo"), obo_cache_path),
+                (None, None)])
+            self.assertTrue(os.path.isfile(obo_cache_path))
+            self.assertEqual(self.df._get_cached_file(cache_path=gz_cache_path, file_source_url=""),
+                             gz_cache_path.replace(".gz", ""))
+            self.assertEqual(self.df._get_cached_file(cache_path=obo_cache_path, file_source_url=""), obo_cache_path)
+            self.assertEqual(len(self.df.prefetched_files), 0)
+            # prefetched files that are not read are not reused by later loads
+            self.df.prefetch_files([("file://" + os.path.join(self.this_dir, "data", "doid.obo"), obo_cache_path)])
+            self.assertEqual(len(self.df.prefetched_files), 1)
+            self.df.discard_prefetched_files()
+            self.assertEqual(len(self.df.prefetched_files), 0)
+
     def test_gene_data_functions(self):
         self.df.set_gene_data(gene_data=[Gene("1", "gene1", True, False), Gene("2", "gene2", False, True),
                                          Gene("3", "gene3", False, False), Gene("4", "gene4", True, True)])
@@ -6,7 +6,7 @@ from ontobio import AssociationSetFactory
 from genedescriptions.commons import Module
 from genedescriptions.config_parser import GenedescConfigParser
 from genedescriptions.data_manager import DataManager, DataType
-from genedescriptions.descriptions_generator import OntologySentenceGenerator
+from genedescriptions.descriptions_generator import OntologySentenceGenerator, generate_module_sentences_parallel
 from genedescriptions.ontology_tools import set_ic_ontology_struct
 
 logger = logging.getLogger("Gene Ontology Module tests")
@@ -56,6 +56,70 @@ class TestDescriptionsGenerator(unittest.TestCase):
                                                            keep_only_best_group=True)
         print(sentences.get_description())
 
+    def test_generate_module_sentences_parallel(self):
+        gene_ids = ["WB:WBGene00000018", "WB:WBGene00000001", "WB:WBGene00002335"]
+        aspects_qualifiers = [("F", ""), ("P", ""), ("C", "")]
+        gene_sentences = generate_module_sentences_parallel(
+            gene_ids=gene_ids, module=Module.GO, data_manager=self.df, config=self.conf_parser,
+            aspects_qualifiers=aspects_qualifiers, keep_only_best_group=True, merge_groups_with_same_prefix=True,
+            max_workers=2, chunksize=1)
+        self.assertEqual(set(gene_sentences.keys()), set(gene_ids))
+        for gene_id in gene_ids:
+            go_sent_generator = OntologySentenceGenerator(gene_id=gene_id, module=Module.GO, data_manager=self.df,
+                                                          config=self.conf_parser)
+            for aspect, qualifier in aspects_qualifiers:
+                sentences = go_sent_generator.get_module_sentences(aspect=aspect, qualifier=qualifier,
+                                                                   merge_groups_with_same_prefix=True,
+                                                                   keep_only_best_group=True)
+                self.assertEqual(gene_sentences[gene_id][(aspect, qualifier)].get_description(),
+                                 sentences.get_description())
+
+    def test_merge_sentences_sets_terms_merged(self):
+        for gene_id in ["WB:WBGene00000018", "WB:WBGene00000001", "WB:WBGene00002335"]:
+            for aspect in ["F", "P", "C"]:
+                go_sent_generator = OntologySentenceGenerator(gene_id=gene_id, module=Module.GO,
+                                                              data_manager=self.df, config=self.conf_parser)
+                sentences = go_sent_generator.get_module_sentences(aspect=aspect, qualifier='',
+                                                                   merge_groups_with_same_prefix=True)
+                self.assertTrue(all(sentence.terms_merged for sentence in sentences.sentences))
+                go_sent_generator = OntologySentenceGenerator(gene_id=gene_id, module=Module.GO,
+                                                              data_manager=self.df, config=self.conf_parser)
+                sentences = go_sent_generator.get_module_sentences(aspect=aspect, qualifier='',
+                                                                   merge_groups_with_same_prefix=False)
+                self.assertTrue(not any(sentence.terms_merged for sentence in sentences.sentences))
+                # a single sentence has nothing to merge with, but is still flagged as merged
+                for sentence in sentences.sentences:
+                    merged = go_sent_generator.merge_sentences_with_same_prefix(
+                        sentences=[sentence], remove_parent_terms=go_sent_generator.del_parents_if_child,
+                        rename_cell=go_sent_generator.rename_cell)
+                    self.assertEqual(len(merged), 1)
+                    self.assertTrue(merged[0].terms_merged)
+                    self.assertEqual(merged[0].text, sentence.text)
+
+    def test_merge_postfix_phrases(self):
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases([]), "")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(["", ""]), "")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(["in the head"]), "in the head")
+        # identical phrases are not joined with themselves
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(["in the head", "in the head"]),
+                         "in the head")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(
+            ["during the embryo stage", "during the embryo stage", "during the embryo stage"]),
+            "during the embryo stage")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(
+            ["during the embryo stage", "", "during the larva stage"]), "during the embryo and larva stages")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(
+            ["during the embryo stage", "during the larva stage", "during the adult stage"]),
+            "during the embryo, larva, and adult stages")
+
+    def test_merge_postfix_phrases_with_repeated_common_parts(self):
+        # the common prefix and suffix are removed only at the ends of the phrases. Removing all their occurrences
+        # gave 'in the embryo head and larva head in the head'
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(
+            ["in the embryo in the head", "in the larva in the head"]), "in the embryo and larva in the head")
+        self.assertEqual(OntologySentenceGenerator.merge_postfix_phrases(
+            ["during the embryo stage", "during the larva stage"]), "during the embryo and larva stages")
+
     def test_generate_sentence_fb(self):
         self.df.load_associations_from_file(associations_type=DataType.GO, associations_url="file://" + os.path.join(
             self.this_dir, "data", "gene_association_1.7.fb.partial"),
@@ -50,4 +50,11 @@ class TestDescriptionsGenerator(unittest.TestCase):
                                                "transport, establishment of mitotic spindle orientation, and positive "
                                                "regulation of extent of heterochromatin assembly")
 
-
+    def test_module_initial_set(self):
+        go_sent_generator = OntologySentenceGenerator(gene_id="FB:FBgn0027655", module=Module.GO,
+                                                      data_manager=self.df, config=self.conf_parser)
+        initial_set = GeneDescription._get_module_initial_set(aspect="P", sentence_generator=go_sent_generator)
+        self.assertEqual(set(initial_set), {"GO:0000132", "GO:0008088", "GO:0033697", "GO:0048489"})
+        self.assertEqual(GeneDescription._get_module_initial_num(aspect="P", sentence_generator=go_sent_generator), 4)
+        self.assertEqual(GeneDescription._get_module_initial_num(aspect="P", sentence_generator=go_sent_generator,
+                                                                 additional_qualifier="contributes_to"), 4)
@@ -143,6 +143,7 @@ class WBDataManager(DataManager):
                     if fields[1].startswith("WBGene"):
                         name = fields[2] if fields[2] != '' else fields[3]
                         self.gene_data["WB:" + fields[1]] = Gene("WB:" + fields[1], name, fields[4] == "Dead", False)
+            self.filtered_genes_cache = {}
 
     def load_associations_from_file(self, associations_type: DataType, associations_url: str,
                                     associations_cache_path: str, config: GenedescConfigParser,
@@ -308,13 +309,10 @@ class WBDataManager(DataManager):
                                                     [domain, ""] for domain in linearr[3:]]
 
     @staticmethod
-    def get_replaced_terms_arr(terms, terms_replacement_regex):
+    def get_replaced_terms_arr(terms, terms_replacement_patterns):
         new_terms = terms
-        for regex_to_substitute, regex_target in terms_replacement_regex.items():
-            tmp_terms = []
-            for term in new_terms:
-                tmp_terms.append(re.sub(regex_to_substitute, regex_target, term))
-            new_terms = tmp_terms
+        for pattern, regex_target in terms_replacement_patterns:
+            new_terms = [pattern.sub(regex_target, term) for term in new_terms]
         return new_terms
 
     def _load_expression_cluster_file(self, file_cache_path, file_url, load_into_data,
@@ -329,12 +327,14 @@ class WBDataManager(DataManager):
                             subj_associations]
         terms_replacement_regex = self.config.get_module_property(module=Module.EXPRESSION,
                                                                   prop=ConfigModuleProperty.RENAME_TERMS)
+        terms_replacement_patterns = [(re.compile(regex_to_substitute), regex_target) for
+                                      regex_to_substitute, regex_target in terms_replacement_regex.items()]
         for line in open(expr_clust_file):
             if not header:
                 linearr = line.strip().split("\t")
                 load_into_data[linearr[0]] = linearr[1:]
                 load_into_data[linearr[0]][2] = WBDataManager.get_replaced_terms_arr(
-                    load_into_data[linearr[0]][2].split(","), terms_replacement_regex)
+                    load_into_data[linearr[0]][2].split(","), terms_replacement_patterns)
                 if load_into_data[linearr[0]] and len(load_into_data[linearr[0]]) > 3 and load_into_data[linearr[0]][3]:
                     load_into_data[linearr[0]][3] = [word.replace(" study", "").replace(" analysis", "") for word in
                                                      load_into_data[linearr[0]][3].split(",")]
@@ -402,24 +402,53 @@ class WBDataManager(DataManager):
 
     def load_all_data_from_file(self) -> None:
         """load all data types from pre-set file locations"""
-        self.load_gene_data_from_file()
-        self.load_ontology_from_file(ontology_type=DataType.GO, ontology_url=self.go_ontology_url,
-                                     ontology_cache_path=self.go_ontology_cache_path,
-                                     config=self.config)
-        self.load_associations_from_file(associations_type=DataType.GO, associations_url=self.go_associations_url,
-                                         associations_cache_path=self.go_associations_cache_path, config=self.config)
-        self.load_ontology_from_file(ontology_type=DataType.DO, ontology_url=self.do_ontology_url,
-                                     ontology_cache_path=self.do_ontology_cache_path, config=self.config)
-        self.load_associations_from_file(associations_type=DataType.DO, associations_url=self.do_associations_url,
-                                         associations_cache_path=self.do_associations_cache_path,
-                                         association_additional_cache_path=self.do_associations_new_cache_path,
-                                         association_additional_url=self.do_associations_new_url, config=self.config)
-        self.load_ontology_from_file(ontology_type=DataType.EXPR, ontology_url=self.expression_ontology_url,
-                                     ontology_cache_path=self.expression_ontology_cache_path, config=self.config)
-        self.load_associations_from_file(associations_type=DataType.EXPR,
-                                         associations_url=self.expression_associations_url,
-                                         associations_cache_path=self.expression_associations_cache_path,
+        files_to_prefetch = [
+            (self.go_ontology_url, self.go_ontology_cache_path),
+            (self.config.get_module_property(module=Module.GO, prop=ConfigModuleProperty.SLIM_URL),
+             self.get_slim_cache_path(self.go_ontology_cache_path, DataType.GO)),
+            (self.go_associations_url, self.go_associations_cache_path),
+            (self.do_ontology_url, self.do_ontology_cache_path),
+            (self.config.get_module_property(module=Module.DO_EXPERIMENTAL, prop=ConfigModuleProperty.SLIM_URL),
+             self.get_slim_cache_path(self.do_ontology_cache_path, DataType.DO)),
+            (self.do_associations_url, self.do_associations_cache_path),
+            (self.do_associations_new_url, self.do_associations_new_cache_path),
+            (self.expression_ontology_url, self.expression_ontology_cache_path),
+            (self.config.get_module_property(module=Module.EXPRESSION, prop=ConfigModuleProperty.SLIM_URL),
+             self.get_slim_cache_path(self.expression_ontology_cache_path, DataType.EXPR)),
+            (self.expression_associations_url, self.expression_associations_cache_path),
+            (self.orthology_url, self.orthology_cache_path),
+            (self.expression_cluster_anatomy_url, self.expression_cluster_anatomy_cache_path),
+            (self.expression_cluster_molreg_url, self.expression_cluster_molreg_cache_path),
+            (self.expression_cluster_genereg_url, self.expression_cluster_genereg_cache_path),
+            (self.protein_domain_url, self.protein_domain_cache_path)]
+        # gene data is read only if it has not been loaded yet. Pairs without url, such as unset slims and expression
+        # clusters, are skipped by the prefetch and are not read by the loaders either
+        if not self.gene_data:
+            files_to_prefetch.append((self.gene_data_url, self.gene_data_cache_path))
+        self.prefetch_files(files_to_prefetch)
+        try:
+            self.load_gene_data_from_file()
+            self.load_ontology_from_file(ontology_type=DataType.GO, ontology_url=self.go_ontology_url,
+                                         ontology_cache_path=self.go_ontology_cache_path,
                                          config=self.config)
-        self.load_orthology_from_file()
-        self.load_expression_cluster_data()
-        self.load_protein_domain_information()
+            self.load_associations_from_file(associations_type=DataType.GO, associations_url=self.go_associations_url,
+                                             associations_cache_path=self.go_associations_cache_path,
+                                             config=self.config)
+            self.load_ontology_from_file(ontology_type=DataType.DO, ontology_url=self.do_ontology_url,
+                                         ontology_cache_path=self.do_ontology_cache_path, config=self.config)
+            self.load_associations_from_file(associations_type=DataType.DO, associations_url=self.do_associations_url,
+                                             associations_cache_path=self.do_associations_cache_path,
+                                             association_additional_cache_path=self.do_associations_new_cache_path,
+                                             association_additional_url=self.do_associations_new_url,
+                                             config=self.config)
+            self.load_ontology_from_file(ontology_type=DataType.EXPR, ontology_url=self.expression_ontology_url,
+                                         ontology_cache_path=self.expression_ontology_cache_path, config=self.config)
+            self.load_associations_from_file(associations_type=DataType.EXPR,
+                                             associations_url=self.expression_associations_url,
+                                             associations_cache_path=self.expression_associations_cache_path,
+                                             config=self.config)
+            self.load_orthology_from_file()
+            self.load_expression_cluster_data()
+            self.load_protein_domain_information()
+        finally:
+            self.discard_prefetched_files()